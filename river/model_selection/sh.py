@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import abc
+import heapq
 import math
+import operator
 
 from river import metrics
 from river.model_selection.base import ModelSelectionClassifier, ModelSelectionRegressor
@@ -27,16 +29,32 @@ class SuccessiveHalving(abc.ABC):
 
         self._n = len(models)
         self._metrics = [metric.clone() for _ in range(self._n)]
+        pred_method = self._pred_method
+        self._pred_funcs = [getattr(model, pred_method) for model in models]
         self._s = self._n
         self._n_rungs = 0
         self._rankings = list(range(self._n))
-        self._r = math.floor(budget / (self._s * math.ceil(math.log(self._n, eta))))
+        self._n_rungs_total = math.ceil(math.log(self._n, eta))
+        self._r = budget // (self._s * self._n_rungs_total)
+        self._rung_end = self._r if self._s > 1 else None
         self._budget_used = 0
         self._n_iterations = 0
         self._best_model_idx = 0
+        self._bigger_is_better = metric.bigger_is_better
+        self._cmp = operator.gt if self._bigger_is_better else operator.lt
+        self._best_metric_value = self._metrics[self._best_model_idx].get()
+        self._active = self._active_models()
 
+    @property
     @abc.abstractmethod
-    def _pred_func(self, model): ...
+    def _pred_method(self) -> str: ...
+
+    def _active_models(self):
+        """The models still competing, with their index, metric, and prediction function."""
+        return [
+            (i, self.models[i], self._metrics[i], self._pred_funcs[i])
+            for i in self._rankings[: self._s]
+        ]
 
     @property
     def best_model(self):
@@ -44,33 +62,47 @@ class SuccessiveHalving(abc.ABC):
         return self.models[self._best_model_idx]
 
     def learn_one(self, x, y):
-        for i in self._rankings[: self._s]:
-            model = self.models[i]
-            metric = self._metrics[i]
-            y_pred = self._pred_func(model)(x)
+        # The attributes accessed for every model are bound to local variables
+        cmp = self._cmp
+        best_model_idx = self._best_model_idx
+        best_metric_value = self._best_metric_value
+
+        for i, model, metric, pred_func in self._active:
+            y_pred = pred_func(x)
             metric.update(y_true=y, y_pred=y_pred)
             model.learn_one(x, y)
 
-            # Check for a new best model
-            if metric.is_better_than(self._metrics[self._best_model_idx]):
-                self._best_model_idx = i
-
+            # Check for a new best model. The best model's metric value is cached, so that it only
+            # has to be refreshed when the best model itself gets updated. The best model can't
+            # dethrone itself, so there is no need to compare it with the cached value.
+            value = metric.get()
+            if i == best_model_idx:
+                best_metric_value = value
+            elif cmp(value, best_metric_value):
+                best_model_idx = i
+                best_metric_value = value
+
+        self._best_model_idx = best_model_idx
+        self._best_metric_value = best_metric_value
         self._n_iterations += 1
 
-        if self._s > 1 and self._n_iterations == self._r:
+        if self._n_iterations == self._rung_end:
             self._n_rungs += 1
             self._budget_used += self._s * self._r
 
-            # Update the rankings of the current models based on their respective metric values
-            self._rankings[: self._s] = sorted(
-                self._rankings[: self._s],
-                key=lambda i: self._metrics[i].get(),
-                reverse=self.metric.bigger_is_better,
-            )
-
             # Determine how many models to keep for the current rung
             cutoff = math.ceil(self._s / self.eta)
 
+            # Rank the models that make the cut based on their respective metric values. The
+            # selection is stable, so ties are resolved in favor of the models that were ranked
+            # first at the previous rung. The eliminated models are moved after the survivors.
+            contenders = self._rankings[: self._s]
+            scores = {i: self._metrics[i].get() for i in contenders}
+            select = heapq.nlargest if self._bigger_is_better else heapq.nsmallest
+            survivors = select(cutoff, contenders, key=scores.__getitem__)
+            kept = set(survivors)
+            self._rankings[: self._s] = survivors + [i for i in contenders if i not in kept]
+
             if self.verbose:
                 print(
                     "\t".join(
@@ -89,7 +121,9 @@ class SuccessiveHalving(abc.ABC):
 
             # Determine where the next rung is located
             self._s = cutoff
-            self._r = math.floor(self.budget / (self._s * math.ceil(math.log(self._n, self.eta))))
+            self._r = self.budget // (self._s * self._n_rungs_total)
+            self._rung_end = self._r if self._s > 1 else None
+            self._active = self._active_models()
 
 
 class SuccessiveHalvingRegressor(SuccessiveHalving, ModelSelectionRegressor):
@@ -237,8 +271,9 @@ class SuccessiveHalvingRegressor(SuccessiveHalving, ModelSelectionRegressor):
 
     """
 
-    def _pred_func(self, model):
-        return model.predict_one
+    @property
+    def _pred_method(self):
+        return "predict_one"
 
     def predict_one(self, x):
         return self.best_model.predict_one(x)
@@ -397,10 +432,9 @@ class SuccessiveHalvingClassifier(SuccessiveHalving, ModelSelectionClassifier):
 
     """
 
-    def _pred_func(self, model):
-        if self.metric.requires_labels:
-            return model.predict_one
-        return model.predict_proba_one
+    @property
+    def _pred_method(self):
+        return "predict_one" if self.metric.requires_labels else "predict_proba_one"
 
     def predict_proba_one(self, x):
         return self.best_model.predict_proba_one(x)
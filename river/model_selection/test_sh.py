@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import itertools
+
+from river import datasets, dummy, metrics, model_selection, stats
+
+
+def test_ties_are_resolved_in_favor_of_the_earliest_ranked_models():
+    # The first model is clearly worse, while the other three are identical and thus always tied
+    models = [dummy.StatisticRegressor(stats.Var())] + [
+        dummy.StatisticRegressor(stats.Mean()) for _ in range(3)
+    ]
+    sh = model_selection.SuccessiveHalvingRegressor(models, metric=metrics.MAE(), budget=400, eta=2)
+    dataset = datasets.TrumpApproval()
+
+    # The first rung ends after 50 iterations, at which point half of the models are kept
+    for x, y in itertools.islice(dataset, 50):
+        sh.learn_one(x, y)
+    assert sh._rankings[: sh._s] == [1, 2]
+
+    # The second rung ends after 100 iterations, at which point a single model is left
+    for x, y in itertools.islice(dataset, 50, 100):
+        sh.learn_one(x, y)
+    assert sh._rankings[: sh._s] == [1]
+
+    # The tied models never dethrone the first of them to have taken the lead
+    assert sh.best_model is sh.models[1]
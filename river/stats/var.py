@@ -80,10 +80,13 @@ class Var(stats.base.Univariate):
         return self.mean.n
 
     def update(self, x, w=1.0):
-        mean_old = self.mean.get()
-        self.mean.update(x, w)
-        mean_new = self.mean.get()
-        self._S += w * (x - mean_old) * (x - mean_new)
+        # This is equivalent to calling self.mean.update, but it is inlined because this method
+        # sits on the hot path of many estimators, such as the leaves of regression trees
+        mean = self.mean
+        delta = x - mean._mean
+        mean.n += w
+        mean._mean += (w / mean.n) * delta
+        self._S += w * delta * (x - mean._mean)
 
     def revert(self, x, w=1.0):
         mean_old = self.mean.get()
@@ -138,6 +138,8 @@ class LeafModel(LeafMean):
 
         if self._model_supports_weights:
             self._leaf_model.learn_one(x, y, w)
+        elif w == 1.0:
+            self._leaf_model.learn_one(x, y)
         else:
             for _ in range(int(w)):
                 self._leaf_model.learn_one(x, y)
@@ -176,9 +178,10 @@ class LeafAdaptive(LeafModel):
     def learn_one(self, x, y, *, w=1.0, tree=None):
         pred_mean = self.stats.mean.get()
         pred_model = self._leaf_model.predict_one(x)
+        decay = tree.model_selector_decay
 
-        self._fmse_mean = tree.model_selector_decay * self._fmse_mean + (y - pred_mean) ** 2
-        self._fmse_model = tree.model_selector_decay * self._fmse_model + (y - pred_model) ** 2
+        self._fmse_mean = decay * self._fmse_mean + (y - pred_mean) ** 2
+        self._fmse_model = decay * self._fmse_model + (y - pred_model) ** 2
 
         super().learn_one(x, y, w=w, tree=tree)
 
@@ -186,4 +189,4 @@ class LeafAdaptive(LeafModel):
         if self._fmse_mean < self._fmse_model:  # Act as a regression tree
             return self.stats.mean.get()
         else:  # Act as a model tree
-            return super().prediction(x)
+            return self._leaf_model.predict_one(x)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import collections
 import functools
 import inspect
 from copy import deepcopy
@@ -108,6 +107,8 @@ class LeafModelMultiTarget(LeafMeanMultiTarget):
             # Now the proper training
             if self._model_supports_weights[target_id]:
                 model.learn_one(x, y_, w)
+            elif w == 1.0:
+                model.learn_one(x, y_)
             else:
                 for _ in range(int(w)):
                     model.learn_one(x, y_)
@@ -142,19 +143,20 @@ class LeafAdaptiveMultiTarget(LeafModelMultiTarget):
 
     def __init__(self, stats, depth, splitter, leaf_models, **kwargs):
         super().__init__(stats, depth, splitter, leaf_models, **kwargs)
-        self._fmse_mean = collections.defaultdict(float)
-        self._fmse_model = collections.defaultdict(float)
+        # Faded errors of the mean and of the model, paired for each target
+        self._fmse = {}
 
     def learn_one(self, x, y, *, w=1.0, tree=None):
-        pred_mean = {t: self.stats[t].mean.get() if t in self.stats else 0.0 for t in tree.targets}
         pred_model = super().prediction(x, tree=tree)
+        decay = tree.model_selector_decay
 
-        for t in tree.targets:  # Update the faded errors
-            self._fmse_mean[t] = (
-                tree.model_selector_decay * self._fmse_mean[t] + (y[t] - pred_mean[t]) ** 2
-            )
-            self._fmse_model[t] = (
-                tree.model_selector_decay * self._fmse_model[t] + (y[t] - pred_model[t]) ** 2
+        # Update the faded errors of all the targets in a single pass
+        for t in tree.targets:
+            fmse_mean, fmse_model = self._fmse.get(t, (0.0, 0.0))
+            pred_mean = self.stats[t].mean.get() if t in self.stats else 0.0
+            self._fmse[t] = (
+                decay * fmse_mean + (y[t] - pred_mean) ** 2,
+                decay * fmse_model + (y[t] - pred_model[t]) ** 2,
             )
 
         super().learn_one(x, y, w=w, tree=tree)
@@ -162,7 +164,8 @@ class LeafAdaptiveMultiTarget(LeafModelMultiTarget):
     def prediction(self, x, *, tree=None):
         pred = {}
         for t in tree.targets:
-            if self._fmse_mean[t] < self._fmse_model[t]:  # Act as a regression tree
+            fmse_mean, fmse_model = self._fmse.get(t, (0.0, 0.0))
+            if fmse_mean < fmse_model:  # Act as a regression tree
                 pred[t] = self.stats[t].mean.get() if t in self.stats else 0.0
             else:  # Act as a model tree
                 try:
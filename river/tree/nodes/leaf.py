@@ -7,6 +7,9 @@ import typing
 from ..base import Leaf
 from ..utils import BranchFactory
 
+# Most leaves never disable any attribute, so they all share this empty set
+_NO_DISABLED_ATTRS: frozenset = frozenset()
+
 
 class HTLeaf(Leaf, abc.ABC):
     """Base leaf class to be used in Hoeffding Trees.
@@ -32,7 +35,7 @@ class HTLeaf(Leaf, abc.ABC):
         self.splitter = splitter
 
         self.splitters = {}
-        self._disabled_attrs = set()
+        self._disabled_attrs = _NO_DISABLED_ATTRS
         self._last_split_attempt_at = self.total_weight
 
     @property
@@ -147,7 +150,7 @@ class HTLeaf(Leaf, abc.ABC):
         """
         if att_id in self.splitters:
             del self.splitters[att_id]
-            self._disabled_attrs.add(att_id)
+            self._disabled_attrs = self._disabled_attrs | {att_id}
 
     def learn_one(self, x, y, *, w=1.0, tree=None):
         """Update the node with the provided sample.